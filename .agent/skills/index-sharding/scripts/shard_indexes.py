@@ -0,0 +1,326 @@
+"""
+Build and read a sharded version of the Schemas/Indexes JSON files.
+
+objects.json, revisions.json and models.json are single documents that
+repeat every object's full description. This script splits them into
+small shards under Schemas/Indexes/Shards/:
+
+    manifest.json                       index -> field -> shard listing
+    descriptions/<id prefix>.json       description text, stored once per id
+    <index>/<field>/<uuid prefix>.json  entries, with description_ref instead
+                                        of the description text
+
+Only shards whose content changed are rewritten, and shards that are no
+longer listed in the manifest are removed. Readers load the manifest and
+then open just the shards holding the requested uuid.
+
+Usage:
+    python shard_indexes.py
+    python shard_indexes.py --prefix-length 1
+    python shard_indexes.py --get 8f88da38-ac40-4c93-b7b0-696ec02cea7a
+    python shard_indexes.py --repo-root /path/to/InitTide
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+MANIFEST_VERSION = 1
+DEFAULT_PREFIX_LENGTH = 2
+DESCRIPTION_ID_LENGTH = 20
+SHARDED_INDEXES = ("objects", "revisions", "models")
+
+
+def find_repo_root(start: Path = Path(__file__)) -> Path:
+    """Walk up from this script to find the repo root (contains Schemas/)."""
+    current = start.resolve().parent
+    for _ in range(10):
+        if (current / "Schemas").is_dir() and (current / "Objects").is_dir():
+            return current
+        current = current.parent
+    raise FileNotFoundError("Could not locate repository root with Schemas/ and Objects/ directories.")
+
+
+def dump_json(data) -> str:
+    """Serialize deterministically so unchanged shards compare byte-equal."""
+    return json.dumps(data, indent=4, ensure_ascii=False, sort_keys=True) + "\n"
+
+
+def description_id(text: str) -> str:
+    """Content-address a description so identical text is stored once."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:DESCRIPTION_ID_LENGTH]
+
+
+def field_from_name(name: str) -> str:
+    """Fallback shard directory for an object type not listed in objects.json or models.json."""
+    return name.strip().lower().replace(" ", "_")
+
+
+def load_index(index_path: Path) -> dict:
+    """Load one of the monolithic index files, or an empty index if absent."""
+    if not index_path.exists():
+        print(f"WARNING: {index_path} does not exist. Treating as empty.")
+        return {}
+    with open(index_path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def group_by_field(index_name: str, index: dict, field_names: dict) -> dict:
+    """Normalize an index to {field: {"metadata": ..., "entries": {uuid: entry}}}.
+
+    objects.json and models.json are already grouped by field. revisions.json
+    is keyed directly by uuid, with the object type name in each entry.
+    """
+    if index_name != "revisions":
+        return {
+            field: {"metadata": body.get("metadata", {}), "entries": body.get("entries", {})}
+            for field, body in index.items()
+        }
+
+    grouped = {}
+    for uuid, entry in index.items():
+        object_name = entry.get("object", "")
+        field = field_names.get(object_name) or field_from_name(object_name)
+        grouped.setdefault(field, {"metadata": {}, "entries": {}})["entries"][uuid] = entry
+    return grouped
+
+
+def build_shards(indexes: dict, prefix_length: int) -> tuple[dict, dict]:
+    """Split the loaded indexes into shard files and the manifest describing them.
+
+    Returns (shards, manifest) where shards maps a path relative to the
+    shards directory to the JSON content of that shard.
+    """
+    field_names = {
+        body.get("metadata", {}).get("name"): field
+        for index_name in ("models", "objects")
+        for field, body in indexes.get(index_name, {}).items()
+    }
+
+    shards = {}
+    descriptions = {}
+    manifest = {
+        "version": MANIFEST_VERSION,
+        "prefix_length": prefix_length,
+        "indexes": {},
+        "descriptions": {},
+    }
+
+    for index_name in SHARDED_INDEXES:
+        grouped = group_by_field(index_name, indexes.get(index_name, {}), field_names)
+        index_manifest = manifest["indexes"][index_name] = {}
+
+        for field, body in grouped.items():
+            field_shards = {}
+            for uuid, entry in body["entries"].items():
+                entry = dict(entry)
+                text = entry.pop("description", None)
+                if text is not None:
+                    desc_id = description_id(text)
+                    if descriptions.setdefault(desc_id, text) != text:
+                        raise ValueError(f"Description id collision on {desc_id}")
+                    entry["description_ref"] = desc_id
+                uuid = uuid.lower()
+                field_shards.setdefault(uuid[:prefix_length], {})[uuid] = entry
+
+            index_manifest[field] = {"metadata": body["metadata"], "shards": {}}
+            for prefix, entries in field_shards.items():
+                shard_path = f"{index_name}/{field}/{prefix}.json"
+                shards[shard_path] = entries
+                index_manifest[field]["shards"][prefix] = {
+                    "path": shard_path,
+                    "entries": len(entries),
+                }
+
+    description_shards = {}
+    for desc_id, text in descriptions.items():
+        description_shards.setdefault(desc_id[:prefix_length], {})[desc_id] = text
+    for prefix, texts in description_shards.items():
+        shard_path = f"descriptions/{prefix}.json"
+        shards[shard_path] = texts
+        manifest["descriptions"][prefix] = {"path": shard_path, "entries": len(texts)}
+
+    return shards, manifest
+
+
+def write_if_changed(path: Path, serialized: str) -> bool:
+    """Atomically replace a file if its content differs, so readers never see partial JSON."""
+    if path.exists() and path.read_text(encoding="utf-8") == serialized:
+        return False
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # A unique temporary name, so concurrent builds never write to the same file
+    with tempfile.NamedTemporaryFile(
+        "w", encoding="utf-8", dir=path.parent, prefix=f".{path.name}.", suffix=".tmp", delete=False
+    ) as f:
+        f.write(serialized)
+    try:
+        os.replace(f.name, path)
+    except OSError:
+        os.unlink(f.name)
+        raise
+    return True
+
+
+def write_shards(shards_dir: Path, shards: dict, manifest: dict) -> tuple[int, int, int]:
+    """Write changed shards, then the manifest, then drop stale shards.
+
+    Stale shards are only removed once the new manifest no longer lists
+    them. Returns (written, unchanged, removed) shard counts.
+    """
+    written = unchanged = removed = 0
+
+    for rel_path, content in shards.items():
+        if write_if_changed(shards_dir / rel_path, dump_json(content)):
+            written += 1
+        else:
+            unchanged += 1
+
+    write_if_changed(shards_dir / "manifest.json", dump_json(manifest))
+
+    for shard_path in sorted(shards_dir.rglob("*.json")):
+        rel_path = shard_path.relative_to(shards_dir).as_posix()
+        if rel_path != "manifest.json" and rel_path not in shards:
+            shard_path.unlink(missing_ok=True)
+            removed += 1
+    for directory in sorted(shards_dir.rglob("*"), reverse=True):
+        if directory.is_dir() and not any(directory.iterdir()):
+            try:
+                directory.rmdir()
+            except OSError:
+                # Another build wrote into it in the meantime
+                pass
+
+    return written, unchanged, removed
+
+
+def load_manifest(shards_dir: Path) -> dict:
+    """Load the shard manifest, checking it is a version this script understands."""
+    with open(shards_dir / "manifest.json", "r", encoding="utf-8") as f:
+        manifest = json.load(f)
+    if manifest.get("version") != MANIFEST_VERSION:
+        raise ValueError(f"Unsupported shard manifest version: {manifest.get('version')}")
+    return manifest
+
+
+def load_shard(shards_dir: Path, rel_path: str) -> dict:
+    """Load a single shard file."""
+    with open(shards_dir / rel_path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def resolve_description(shards_dir: Path, manifest: dict, desc_id: str) -> str | None:
+    """Fetch a description's text by id from its description shard."""
+    shard = manifest["descriptions"].get(desc_id[: manifest["prefix_length"]])
+    if shard is None:
+        return None
+    return load_shard(shards_dir, shard["path"]).get(desc_id)
+
+
+def read_entry(
+    shards_dir: Path,
+    uuid: str,
+    index_name: str = "objects",
+    field: str | None = None,
+    manifest: dict | None = None,
+) -> tuple[str, dict] | None:
+    """Look up one entry by uuid, opening only the shards that can hold it.
+
+    If field is not given, each field with a shard for the uuid prefix is
+    checked in turn. Returns (field, entry) with the description inlined
+    back, or None if the uuid is not indexed.
+    """
+    manifest = manifest or load_manifest(shards_dir)
+    fields = manifest["indexes"].get(index_name, {})
+    uuid = uuid.lower()
+    prefix = uuid[: manifest["prefix_length"]]
+
+    for candidate in [field] if field else sorted(fields):
+        shard = fields.get(candidate, {}).get("shards", {}).get(prefix)
+        if shard is None:
+            continue
+        entry = load_shard(shards_dir, shard["path"]).get(uuid)
+        if entry is None:
+            continue
+        desc_id = entry.pop("description_ref", None)
+        if desc_id is not None:
+            entry["description"] = resolve_description(shards_dir, manifest, desc_id)
+        return candidate, entry
+    return None
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Shard Schemas/Indexes JSON files by object type and uuid prefix."
+    )
+    parser.add_argument(
+        "--repo-root",
+        type=Path,
+        default=None,
+        help="Path to the InitTide repository root. Auto-detected if not provided.",
+    )
+    parser.add_argument(
+        "--prefix-length",
+        type=int,
+        default=DEFAULT_PREFIX_LENGTH,
+        help=f"Number of uuid characters used to pick a shard (default: {DEFAULT_PREFIX_LENGTH}).",
+    )
+    parser.add_argument(
+        "--index",
+        choices=SHARDED_INDEXES,
+        default="objects",
+        help="Index to read from when using --get (default: objects).",
+    )
+    parser.add_argument(
+        "--get",
+        metavar="UUID",
+        default=None,
+        help="Print a single entry from the existing shards instead of rebuilding them.",
+    )
+    args = parser.parse_args()
+
+    repo_root = args.repo_root or find_repo_root()
+    indexes_dir = repo_root / "Schemas" / "Indexes"
+    shards_dir = indexes_dir / "Shards"
+
+    if args.get is not None:
+        if not args.get.strip():
+            print("ERROR: --get requires a non-empty uuid.")
+            sys.exit(1)
+        if not (shards_dir / "manifest.json").exists():
+            print(f"ERROR: No shard manifest found in {shards_dir}. Build the shards first.")
+            sys.exit(1)
+        result = read_entry(shards_dir, args.get, index_name=args.index)
+        if result is None:
+            print(f"ERROR: {args.get} not found in the {args.index} index.")
+            sys.exit(1)
+        field, entry = result
+        print(json.dumps({"field": field, "uuid": args.get.lower(), **entry}, indent=4, ensure_ascii=False))
+        return
+
+    if args.prefix_length < 1:
+        print("ERROR: --prefix-length must be at least 1.")
+        sys.exit(1)
+
+    print(f"Repository root: {repo_root}")
+    print(f"Indexes dir:     {indexes_dir}")
+    print(f"Shards dir:      {shards_dir}")
+    print()
+
+    indexes = {name: load_index(indexes_dir / f"{name}.json") for name in SHARDED_INDEXES}
+    shards, manifest = build_shards(indexes, args.prefix_length)
+    written, unchanged, removed = write_shards(shards_dir, shards, manifest)
+
+    print(f"Descriptions:    {sum(s['entries'] for s in manifest['descriptions'].values())} unique")
+    for index_name, fields in manifest["indexes"].items():
+        entries = sum(s["entries"] for f in fields.values() for s in f["shards"].values())
+        print(f"  - {index_name}: {entries} entries across {len(fields)} object type(s)")
+    print()
+    print(f"Shards written: {written}, unchanged: {unchanged}, removed: {removed}")
+
+
+if __name__ == "__main__":
+    main()
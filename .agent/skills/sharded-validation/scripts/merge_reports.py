@@ -0,0 +1,298 @@
+#!/usr/bin/env python3
+"""
+OpenTide Validation Report Merger
+
+Combines the partial reports written by validate_objects.py into a single
+summary, and runs the checks that need the global uuid set:
+
+- every shard 1..N is present exactly once
+- no object uuid or DOM signal uuid is defined twice
+- every DOM threat points to a TVM, and every MDR detection_model to a DOM signal
+
+With --update-enums, the Detection Objective threats enum and the MDR
+detection_model enum are rebuilt from the merged reports, reusing the
+DOM and MDR generation skill scripts, so no job has to rescan Objects/.
+The enums are only rewritten when the shard set is complete and no global
+problem was found, since a partial report set would drop live uuids.
+
+Usage:
+    python merge_reports.py reports/*.json --summary validation-summary.json
+    python merge_reports.py reports/*.json --update-enums
+"""
+
+import argparse
+import importlib.util
+import json
+import sys
+from collections import Counter
+from pathlib import Path
+
+REPORT_VERSION = 1
+RECORD_KEYS = {"path", "object", "uuid", "name", "valid", "errors", "references", "signals"}
+SIGNAL_TYPE = "Detection Signals"
+
+# Reference field -> type of the uuid it must point to, matching the schema
+# enums the DOM and MDR generation skills maintain
+REFERENCE_TARGETS = {
+    "objective.threats": "Threat Vectors",
+    "detection_model": SIGNAL_TYPE,
+}
+
+SKILLS_DIR = Path(__file__).resolve().parent.parent.parent
+
+
+def find_repo_root(start: Path = Path(__file__)) -> Path:
+    """Walk up from this script to find the repo root (contains Schemas/)."""
+    current = start.resolve().parent
+    for _ in range(10):
+        if (current / "Schemas").is_dir() and (current / "Objects").is_dir():
+            return current
+        current = current.parent
+    raise FileNotFoundError("Could not locate repository root with Schemas/ and Objects/ directories.")
+
+
+def load_skill_script(rel_path: str):
+    """Import a script from another skill directory as a module."""
+    script_path = SKILLS_DIR / rel_path
+    spec = importlib.util.spec_from_file_location(script_path.stem, script_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def is_record_list(items, keys: tuple) -> bool:
+    """Check a list of mappings whose given keys all hold strings."""
+    return isinstance(items, list) and all(
+        isinstance(item, dict) and all(isinstance(item.get(k), str) for k in keys) for item in items
+    )
+
+
+def record_reason(record) -> str | None:
+    """Describe why an object record does not have the structure merge relies on."""
+    if not isinstance(record, dict) or not RECORD_KEYS <= record.keys():
+        return "object record is missing required keys"
+    if not isinstance(record["path"], str) or not isinstance(record["object"], str):
+        return "object record has an invalid path or object type"
+    if record["uuid"] is not None and not isinstance(record["uuid"], str):
+        return f"{record['path']}: uuid must be a string"
+    if not is_record_list(record["errors"], ("location", "message")):
+        return f"{record['path']}: invalid errors"
+    if not is_record_list(record["references"], ("field", "uuid")):
+        return f"{record['path']}: invalid references"
+    if not is_record_list(record["signals"], ("uuid", "name")):
+        return f"{record['path']}: invalid signals"
+    return None
+
+
+def malformed_reason(report) -> str | None:
+    """Describe why a report does not have the structure written by validate_objects.py."""
+    if not isinstance(report, dict):
+        return "report is not a JSON object"
+    if report.get("version") != REPORT_VERSION:
+        return f"unsupported report version {report.get('version')}"
+    shard = report.get("shard")
+    if not isinstance(shard, dict) or not all(isinstance(shard.get(k), int) for k in ("index", "total")):
+        return "missing or invalid shard index/total"
+    if shard["total"] < 1 or not 1 <= shard["index"] <= shard["total"]:
+        return f"impossible shard {shard['index']}/{shard['total']}"
+    unvalidated = report.get("unvalidated", {})
+    if not isinstance(unvalidated, dict) or not all(
+        isinstance(subtrees, list) and all(isinstance(p, str) for p in subtrees)
+        for subtrees in unvalidated.values()
+    ):
+        return "unvalidated must map object types to lists of subtrees"
+    objects = report.get("objects")
+    if not isinstance(objects, list):
+        return "missing or invalid object records"
+    for record in objects:
+        reason = record_reason(record)
+        if reason:
+            return reason
+    return None
+
+
+def load_reports(report_paths: list[Path]) -> tuple[list[dict], list[str]]:
+    """Load the shard reports and check they form one complete partition."""
+    reports = []
+    problems = []
+    for report_path in report_paths:
+        try:
+            with open(report_path, "r", encoding="utf-8") as f:
+                report = json.load(f)
+        except Exception as e:
+            problems.append(f"Could not read report {report_path}: {e}")
+            continue
+        reason = malformed_reason(report)
+        if reason:
+            problems.append(f"Malformed report {report_path}: {reason}")
+            continue
+        reports.append(report)
+
+    if not reports:
+        problems.append("No shard reports to merge")
+        return reports, problems
+
+    totals = {r["shard"]["total"] for r in reports}
+    if len(totals) > 1:
+        problems.append(f"Reports come from different shard counts: {sorted(totals)}")
+        return reports, problems
+
+    total = totals.pop()
+    seen = Counter(r["shard"]["index"] for r in reports)
+    missing = sorted(set(range(1, total + 1)) - seen.keys())
+    duplicated = sorted(i for i, count in seen.items() if count > 1)
+    if missing:
+        problems.append(f"Missing report for shard(s) {', '.join(f'{i}/{total}' for i in missing)}")
+    if duplicated:
+        problems.append(f"Duplicate report for shard(s) {', '.join(f'{i}/{total}' for i in duplicated)}")
+    return reports, problems
+
+
+def check_cross_references(objects: list[dict]) -> list[str]:
+    """Check uuid uniqueness and that every reference resolves to the right type, across all shards."""
+    problems = []
+    defined = {}
+    for record in objects:
+        owned = [(record["uuid"], record["object"])] if record["uuid"] else []
+        owned += [(signal["uuid"], SIGNAL_TYPE) for signal in record["signals"]]
+        for uuid, defined_type in owned:
+            if uuid in defined:
+                problems.append(f"Duplicate uuid {uuid} in {record['path']} (also in {defined[uuid][0]})")
+            else:
+                defined[uuid] = (record["path"], defined_type)
+
+    for record in objects:
+        for reference in record["references"]:
+            expected = REFERENCE_TARGETS.get(reference["field"])
+            target = defined.get(reference["uuid"])
+            if expected is None:
+                problems.append(f"{record['path']}: unknown reference field {reference['field']}")
+            elif target is None:
+                problems.append(
+                    f"{record['path']}: {reference['field']} references unknown uuid {reference['uuid']}"
+                )
+            elif target[1] != expected:
+                problems.append(
+                    f"{record['path']}: {reference['field']} references {reference['uuid']}, "
+                    f"a {target[1]} uuid, where a {expected} uuid is required"
+                )
+    return problems
+
+
+def update_enums(repo_root: Path, objects: list[dict]) -> bool:
+    """Rebuild the threats and detection_model schema enums from the merged objects."""
+    threats_enum = load_skill_script("dom-generation/scripts/update_threats_enum.py")
+    detection_model_enum = load_skill_script("mdr-generation/scripts/update_detection_model_enum.py")
+
+    # Same ordering as the skill scripts, which scan each directory sorted by file name
+    by_file = sorted(objects, key=lambda r: Path(r["path"]).name)
+    tvms = [
+        {"uuid": r["uuid"], "name": r["name"], "file": Path(r["path"]).name}
+        for r in by_file
+        if r["object"] == "Threat Vectors" and r["uuid"] and r["name"]
+    ]
+    signals = [
+        {
+            "uuid": signal["uuid"],
+            "name": signal["name"],
+            "dom_name": r["name"] or Path(r["path"]).stem,
+            "file": Path(r["path"]).name,
+        }
+        for r in by_file
+        if r["object"] == "Detection Objectives"
+        for signal in r["signals"]
+    ]
+
+    ok = True
+    if tvms:
+        ok &= threats_enum.update_schema(repo_root / "Schemas" / "Detection Objective.schema.json", tvms)
+        print(f"Updated threats enum with {len(tvms)} TVM UUID(s).")
+    if signals:
+        ok &= detection_model_enum.update_schema(repo_root / "Schemas" / "MDR Schema.json", signals)
+        print(f"Updated detection_model enum with {len(signals)} signal UUID(s).")
+    return ok
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Merge sharded validation reports and run the global cross-reference checks."
+    )
+    parser.add_argument("reports", type=Path, nargs="+", help="Partial reports written by validate_objects.py.")
+    parser.add_argument(
+        "--summary",
+        type=Path,
+        default=None,
+        help="Where to write the merged JSON summary. Not written if omitted.",
+    )
+    parser.add_argument(
+        "--update-enums",
+        action="store_true",
+        help="Rebuild the DOM threats and MDR detection_model schema enums from the reports. "
+        "Refused if any global problem was found.",
+    )
+    parser.add_argument(
+        "--repo-root",
+        type=Path,
+        default=None,
+        help="Path to the InitTide repository root, used by --update-enums. Auto-detected if not provided.",
+    )
+    args = parser.parse_args()
+
+    reports, problems = load_reports(args.reports)
+    objects = sorted((o for r in reports for o in r["objects"]), key=lambda o: o["path"])
+
+    path_counts = Counter(o["path"] for o in objects)
+    for path in sorted(p for p, count in path_counts.items() if count > 1):
+        problems.append(f"{path} was validated by more than one shard")
+    problems += check_cross_references(objects)
+
+    failed = [o for o in objects if not o["valid"]]
+    unvalidated = {}
+    for report in reports:
+        for object_type, subtrees in report.get("unvalidated", {}).items():
+            unvalidated.setdefault(object_type, sorted(subtrees))
+    summary = {
+        "version": REPORT_VERSION,
+        "shards": [f"{i}/{n}" for i, n in sorted((r["shard"]["index"], r["shard"]["total"]) for r in reports)],
+        "validated": len(objects),
+        "failed": len(failed),
+        "skipped": sum(1 for o in objects if "skipped" in o),
+        "unvalidated": unvalidated,
+        "problems": problems,
+        "objects": objects,
+    }
+    if args.summary:
+        args.summary.parent.mkdir(parents=True, exist_ok=True)
+        with open(args.summary, "w", encoding="utf-8") as f:
+            json.dump(summary, f, indent=4, ensure_ascii=False)
+            f.write("\n")
+
+    for record in failed:
+        print(f"[FAIL] {record['path']}")
+        for error in record["errors"]:
+            print(f"    {error['location']}: {error['message']}")
+    for problem in problems:
+        print(f"[ERROR] {problem}")
+
+    print()
+    print(f"Merged {len(reports)} shard report(s): {summary['validated']} object(s) validated, "
+          f"{summary['failed']} failed, {summary['skipped']} without schema, {len(problems)} global problem(s).")
+
+    for object_type, subtrees in unvalidated.items():
+        print(f"NOTE: {object_type} {', '.join(subtrees)} is recomposed by CoreTide and was not validated.")
+
+    if args.update_enums:
+        print()
+        if problems:
+            # Enums built from an incomplete or inconsistent report set would drop live uuids
+            print("Refusing to update schema enums while the merged reports have global problems.")
+            sys.exit(1)
+        if not update_enums(args.repo_root or find_repo_root(), objects):
+            print("Failed to update schema enums.")
+            sys.exit(1)
+
+    sys.exit(1 if failed or problems else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,331 @@
+#!/usr/bin/env python3
+"""
+OpenTide Sharded Object Validator
+
+Validates the object YAML files under Objects/ against their JSON schemas,
+restricted to one deterministic shard of the corpus, and writes a partial
+JSON report for that shard. Files are assigned to shards by a stable hash
+of their path relative to the repository root, so every CI runner computes
+the same partition without any coordination.
+
+Each report also records the uuids an object defines and references, plus
+the TVM and DOM signal data needed by the schema enum updates, so that
+merge_reports.py can run the checks that need the global uuid set.
+
+Usage:
+    python validate_objects.py --shard 1/4 --report reports/shard-1.json
+    python validate_objects.py --repo-root /path/to/InitTide
+"""
+
+import argparse
+import datetime
+import hashlib
+import json
+import sys
+from pathlib import Path
+
+import yaml
+from jsonschema import Draft7Validator
+
+REPORT_VERSION = 1
+
+# Objects/ subdirectory -> schema file in Schemas/
+OBJECT_SCHEMAS = {
+    "Threat Actors": "TAM Schema.json",
+    "Threat Vectors": "TVM Schema.json",
+    "Detection Objectives": "Detection Objective.schema.json",
+    "Detection Models": "CDM Schema.json",
+    "Detection Rules": "MDR Schema.json",
+    "Business Requests": "BDR Schema.json",
+}
+
+# Enums that list the uuids of other objects, kept up to date by the DOM and
+# MDR generation skills. They need the global uuid set, so they are dropped
+# from per-shard validation and merge_reports.py checks the references instead.
+CROSS_REFERENCE_ENUMS = {
+    "Detection Objectives": [("properties", "objective", "properties", "threats", "items")],
+    "Detection Rules": [("properties", "detection_model")],
+}
+
+
+def find_repo_root(start: Path = Path(__file__)) -> Path:
+    """Walk up from this script to find the repo root (contains Schemas/)."""
+    current = start.resolve().parent
+    for _ in range(10):
+        if (current / "Schemas").is_dir() and (current / "Objects").is_dir():
+            return current
+        current = current.parent
+    raise FileNotFoundError("Could not locate repository root with Schemas/ and Objects/ directories.")
+
+
+def parse_shard(value: str) -> tuple[int, int]:
+    """Parse a 1-based 'i/N' shard specification."""
+    try:
+        index, total = (int(part) for part in value.split("/"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Invalid shard '{value}', expected the form i/N (e.g. 2/4)")
+    if total < 1 or not 1 <= index <= total:
+        raise argparse.ArgumentTypeError(f"Invalid shard '{value}', i must be between 1 and N")
+    return index, total
+
+
+def shard_of(rel_path: str, total: int) -> int:
+    """Assign a path to a 1-based shard by stable hash, independent of run or machine."""
+    digest = hashlib.sha256(rel_path.encode("utf-8")).digest()
+    return int.from_bytes(digest[:8], "big") % total + 1
+
+
+def normalize(data):
+    """Make YAML data JSON-compatible: string keys and ISO format dates."""
+    if isinstance(data, dict):
+        return {str(k): normalize(v) for k, v in data.items()}
+    if isinstance(data, list):
+        return [normalize(v) for v in data]
+    if isinstance(data, datetime.date):
+        return data.isoformat()
+    return data
+
+
+def get_path(node: dict, path: tuple):
+    """Walk nested schema keys, returning None if any of them is absent."""
+    for key in path:
+        if not isinstance(node, dict) or key not in node:
+            return None
+        node = node[key]
+    return node
+
+
+def strip_recompositions(node, path: tuple = ()) -> list[str]:
+    """Open up subtrees that CoreTide recomposes at pipeline time.
+
+    A "recomposition" node is an empty placeholder (e.g. MDR configurations,
+    filled from the enabled systems' sub schemas). Those sub schemas are not
+    part of this repository, so the subtree is accepted as-is and its path
+    returned, to be listed as unvalidated in the report.
+    """
+    stripped = []
+    if isinstance(node, dict):
+        if "recomposition" in node:
+            for key in ("properties", "additionalProperties", "required"):
+                node.pop(key, None)
+            return [".".join(p for p in path if p != "properties")]
+        for key, value in node.items():
+            stripped += strip_recompositions(value, path + (key,))
+    elif isinstance(node, list):
+        for value in node:
+            stripped += strip_recompositions(value, path)
+    return stripped
+
+
+def load_schemas(schemas_dir: Path) -> tuple[dict, dict]:
+    """Load a validator for each object type whose schema exists.
+
+    Returns (validators, unvalidated) where unvalidated maps an object type to
+    the recomposed subtrees left out of its schema.
+    """
+    validators = {}
+    unvalidated = {}
+    for object_type, schema_file in OBJECT_SCHEMAS.items():
+        schema_path = schemas_dir / schema_file
+        if not schema_path.exists():
+            continue
+        with open(schema_path, "r", encoding="utf-8") as f:
+            schema = json.load(f)
+        for path in CROSS_REFERENCE_ENUMS.get(object_type, []):
+            node = get_path(schema, path)
+            if node is not None:
+                node.pop("enum", None)
+                node.pop("markdownEnumDescriptions", None)
+                node.setdefault("type", "string")
+        stripped = strip_recompositions(schema)
+        if stripped:
+            unvalidated[object_type] = stripped
+        validators[object_type] = Draft7Validator(schema)
+    return validators, unvalidated
+
+
+def shape_errors(object_type: str, data: dict) -> list[dict]:
+    """Check the structure the reference collection relies on, before reading it."""
+    errors = []
+    if "metadata" in data and not isinstance(data["metadata"], dict):
+        errors.append({"location": "metadata", "message": "metadata must be a mapping"})
+    if object_type == "Detection Objectives" and "objective" in data:
+        objective = data["objective"]
+        if not isinstance(objective, dict):
+            errors.append({"location": "objective", "message": "objective must be a mapping"})
+            return errors
+        for key in ("threats", "signals"):
+            if objective.get(key) is not None and not isinstance(objective[key], list):
+                errors.append({"location": f"objective > {key}", "message": f"{key} must be a list"})
+        signals = objective.get("signals")
+        for i, signal in enumerate(signals if isinstance(signals, list) else []):
+            if not isinstance(signal, dict):
+                errors.append({"location": f"objective > signals > {i}", "message": "signal must be a mapping"})
+    return errors
+
+
+def collect_references(object_type: str, data: dict) -> list[dict]:
+    """Extract the uuids this object points to in other objects."""
+    references = []
+    if object_type == "Detection Objectives":
+        for uuid in (data.get("objective") or {}).get("threats") or []:
+            references.append({"field": "objective.threats", "uuid": str(uuid)})
+    elif object_type == "Detection Rules":
+        if data.get("detection_model"):
+            references.append({"field": "detection_model", "uuid": str(data["detection_model"])})
+    return references
+
+
+def collect_signals(object_type: str, data: dict) -> list[dict]:
+    """Extract the DOM signals, which define uuids of their own."""
+    if object_type != "Detection Objectives":
+        return []
+    signals = []
+    for signal in (data.get("objective") or {}).get("signals") or []:
+        if signal.get("uuid") and signal.get("name"):
+            signals.append({"uuid": str(signal["uuid"]), "name": str(signal["name"])})
+    return signals
+
+
+def validate_object(
+    yaml_file: Path,
+    rel_path: str,
+    object_type: str,
+    validators: dict,
+    allow_missing_schemas: bool = False,
+) -> dict:
+    """Validate one object file and build its report record."""
+    record = {
+        "path": rel_path,
+        "object": object_type,
+        "uuid": None,
+        "name": None,
+        "valid": False,
+        "errors": [],
+        "references": [],
+        "signals": [],
+    }
+
+    try:
+        with open(yaml_file, "r", encoding="utf-8") as f:
+            data = normalize(yaml.safe_load(f))
+    except Exception as e:
+        record["errors"].append({"location": "root", "message": f"YAML parsing error: {e}"})
+        return record
+    if not isinstance(data, dict):
+        record["errors"].append({"location": "root", "message": "File does not contain a YAML mapping"})
+        return record
+
+    record["errors"] = shape_errors(object_type, data)
+    if record["errors"]:
+        return record
+
+    uuid = (data.get("metadata") or {}).get("uuid")
+    record["uuid"] = str(uuid) if uuid else None
+    record["name"] = data.get("name")
+    record["references"] = collect_references(object_type, data)
+    record["signals"] = collect_signals(object_type, data)
+
+    validator = validators.get(object_type)
+    if validator is None:
+        message = f"No schema found for {object_type}"
+        if allow_missing_schemas:
+            record["skipped"] = message
+        else:
+            record["errors"].append({"location": "root", "message": message})
+    else:
+        for error in sorted(validator.iter_errors(data), key=lambda e: list(e.path)):
+            location = " > ".join(str(p) for p in error.path) if error.path else "root"
+            record["errors"].append({"location": location, "message": error.message})
+
+    record["valid"] = not record["errors"]
+    return record
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Validate one deterministic shard of the OpenTide objects and write a partial report."
+    )
+    parser.add_argument(
+        "--repo-root",
+        type=Path,
+        default=None,
+        help="Path to the InitTide repository root. Auto-detected if not provided.",
+    )
+    parser.add_argument(
+        "--shard",
+        type=parse_shard,
+        default=(1, 1),
+        help="Shard to validate, as 1-based i/N (default: 1/1, the whole corpus).",
+    )
+    parser.add_argument(
+        "--report",
+        type=Path,
+        default=None,
+        help="Where to write the JSON partial report (default: validation-shard-<i>-of-<N>.json).",
+    )
+    parser.add_argument(
+        "--allow-missing-schemas",
+        action="store_true",
+        help="Report objects without a schema file as skipped instead of failed.",
+    )
+    args = parser.parse_args()
+
+    repo_root = args.repo_root or find_repo_root()
+    objects_dir = repo_root / "Objects"
+    index, total = args.shard
+    report_path = args.report or Path(f"validation-shard-{index}-of-{total}.json")
+
+    print(f"Repository root: {repo_root}")
+    print(f"Shard:           {index}/{total}")
+    print(f"Report file:     {report_path}")
+    print()
+
+    validators, unvalidated = load_schemas(repo_root / "Schemas")
+    for object_type in OBJECT_SCHEMAS:
+        if object_type not in validators and (objects_dir / object_type).is_dir():
+            if args.allow_missing_schemas:
+                print(f"WARNING: No schema found for {object_type}, its objects will be skipped.")
+            else:
+                print(f"ERROR: No schema found for {object_type}, its objects will fail validation.")
+    for object_type, paths in unvalidated.items():
+        print(f"NOTE: {object_type} {', '.join(paths)} is recomposed by CoreTide and not validated here.")
+
+    records = []
+    for object_type in OBJECT_SCHEMAS:
+        object_dir = objects_dir / object_type
+        if not object_dir.is_dir():
+            continue
+        for yaml_file in sorted(object_dir.glob("*.yaml")):
+            rel_path = yaml_file.relative_to(repo_root).as_posix()
+            if shard_of(rel_path, total) != index:
+                continue
+            records.append(
+                validate_object(yaml_file, rel_path, object_type, validators, args.allow_missing_schemas)
+            )
+
+    report = {
+        "version": REPORT_VERSION,
+        "shard": {"index": index, "total": total},
+        "unvalidated": unvalidated,
+        "objects": records,
+    }
+    report_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(report_path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=4, ensure_ascii=False)
+        f.write("\n")
+
+    failed = [r for r in records if not r["valid"]]
+    for record in records:
+        status = "[FAIL]" if not record["valid"] else "[SKIP]" if "skipped" in record else "[PASS]"
+        print(f"{status} {record['path']}")
+        for error in record["errors"]:
+            print(f"    {error['location']}: {error['message']}")
+
+    print()
+    print(f"Validated {len(records)} object(s) in shard {index}/{total}, {len(failed)} failed.")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+import importlib.util
+import json
+from pathlib import Path
+
+SCRIPT = Path(__file__).resolve().parent.parent / "scripts" / "merge_reports.py"
+spec = importlib.util.spec_from_file_location("merge_reports", SCRIPT)
+merge_reports = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(merge_reports)
+
+TVM_UUID = "8f88da38-ac40-4c93-b7b0-696ec02cea7a"
+DOM_UUID = "bff2f55e-8100-4d10-9172-9a3b1171268f"
+SIGNAL_UUID = "da5a73a9-0d72-4c0b-b003-bce1e8c69be4"
+
+
+def record(path, object_type, uuid, references=(), signals=()):
+    return {
+        "path": path,
+        "object": object_type,
+        "uuid": uuid,
+        "name": Path(path).stem,
+        "valid": True,
+        "errors": [],
+        "references": list(references),
+        "signals": list(signals),
+    }
+
+
+def corpus(detection_model):
+    return [
+        record("Objects/Threat Vectors/TVM.yaml", "Threat Vectors", TVM_UUID),
+        record(
+            "Objects/Detection Objectives/DOM.yaml",
+            "Detection Objectives",
+            DOM_UUID,
+            references=[{"field": "objective.threats", "uuid": TVM_UUID}],
+            signals=[{"uuid": SIGNAL_UUID, "name": "Signal"}],
+        ),
+        record(
+            "Objects/Detection Rules/MDR.yaml",
+            "Detection Rules",
+            "d076a0a4-e467-4346-99a3-5dd011a2df04",
+            references=[{"field": "detection_model", "uuid": detection_model}],
+        ),
+    ]
+
+
+def write_report(tmp_path, name, report):
+    path = tmp_path / name
+    path.write_text(json.dumps(report), encoding="utf-8")
+    return path
+
+
+def report(index, total, objects=(), **extra):
+    return {"version": 1, "shard": {"index": index, "total": total}, "objects": list(objects), **extra}
+
+
+def test_references_to_the_right_type_resolve():
+    assert merge_reports.check_cross_references(corpus(SIGNAL_UUID)) == []
+
+
+def test_detection_model_pointing_at_a_tvm_is_rejected():
+    problems = merge_reports.check_cross_references(corpus(TVM_UUID))
+    assert len(problems) == 1
+    assert "detection_model" in problems[0] and "Threat Vectors" in problems[0]
+
+
+def test_detection_model_pointing_at_a_dom_object_is_rejected():
+    assert len(merge_reports.check_cross_references(corpus(DOM_UUID))) == 1
+
+
+def test_threat_pointing_at_a_signal_is_rejected():
+    objects = corpus(SIGNAL_UUID)
+    objects[1]["references"] = [{"field": "objective.threats", "uuid": SIGNAL_UUID}]
+    assert len(merge_reports.check_cross_references(objects)) == 1
+
+
+def test_impossible_shards_are_malformed(tmp_path):
+    paths = [
+        write_report(tmp_path, "a.json", report(1, 1)),
+        write_report(tmp_path, "b.json", report(5, 1)),
+        write_report(tmp_path, "c.json", report(0, 0)),
+    ]
+    _, problems = merge_reports.load_reports(paths)
+    assert len(problems) == 2
+    assert all("impossible shard" in p for p in problems)
+
+
+def test_malformed_nested_data_is_reported_not_raised(tmp_path):
+    bad_reference = corpus(SIGNAL_UUID)
+    bad_reference[2]["references"] = [{"field": "detection_model"}]
+    bad_signal = corpus(SIGNAL_UUID)
+    bad_signal[1]["signals"] = ["oops"]
+    paths = [
+        write_report(tmp_path, "references.json", report(1, 1, bad_reference)),
+        write_report(tmp_path, "signals.json", report(1, 1, bad_signal)),
+        write_report(tmp_path, "unvalidated.json", report(1, 1, corpus(SIGNAL_UUID), unvalidated=[])),
+    ]
+    reports, problems = merge_reports.load_reports(paths)
+    assert reports == []
+    assert [p.split(": ", 1)[0] for p in problems[:3]] == [f"Malformed report {p}" for p in paths]